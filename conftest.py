@@ -0,0 +1,14 @@
+"""
+pytest configuration for The Walking Dead Webisodes Downloader tests
+"""
+
+import pytest
+
+import test_twd_downloader
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _close_shared_clients():
+    """Close the HTTP clients the tests share once the session is over"""
+    yield
+    test_twd_downloader.close_shared_clients()
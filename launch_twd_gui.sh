@@ -11,14 +11,17 @@ SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
 # Change to the script directory
 cd "$SCRIPT_DIR"
 
+# Interpreter to use; set PYTHON=pypy3 to run under PyPy
+PYTHON="${PYTHON:-python3}"
+
 # Check if Python 3 is available
-if ! command -v python3 &> /dev/null; then
+if ! command -v "$PYTHON" &> /dev/null; then
     echo "Error: Python 3 is required but not found. Please install Python 3."
     exit 1
 fi
 
 # Check if tkinter is available (required for GUI)
-if ! python3 -c "import tkinter" 2>/dev/null; then
+if ! "$PYTHON" -c "import tkinter" 2>/dev/null; then
     echo "Error: tkinter is required for the GUI but not found."
     echo "Please install tkinter:"
     echo "  Ubuntu/Debian: sudo apt install python3-tk"
@@ -28,6 +31,6 @@ if ! python3 -c "import tkinter" 2>/dev/null; then
 fi
 
 # Run the GUI
-python3 twd_webisodes_gui.py
+"$PYTHON" twd_webisodes_gui.py
 
 echo "GUI closed."
@@ -17,27 +17,94 @@ License: MIT
 import tkinter as tk
 from tkinter import ttk, scrolledtext, messagebox
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import List, Optional, Tuple
+from bisect import bisect_left
+from collections import Counter
+from functools import cache
+from hashlib import blake2b
+from operator import attrgetter
 import json
+import os
+import sys
+import threading
 from pathlib import Path
 import webbrowser
 
-@dataclass
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from orjson import dumps as orjson_dumps, loads as json_loads, OPT_INDENT_2
+except ImportError:
+    orjson_dumps = None
+    json_loads = json.loads
+
+# Chronological watchlist data, shipped alongside this module
+WATCHLIST_FILE = Path(__file__).with_name("watchlist.json")
+
+# Treeview rows are inserted lazily, this many at a time
+TREE_CHUNK_SIZE = 100
+
+# Fields written by the watchlist export, in output order
+_EXPORT_KEYS = ('title', 'series', 'season', 'episode', 'timeline_date', 'description',
+                'duration', 'is_webisode', 'webisode_count', 'importance', 'notes')
+_EXPORT_GET = attrgetter(*_EXPORT_KEYS)
+_EXPORT_NULLABLE_KEYS = ('season', 'episode', 'webisode_count')
+
+# Write buffer for exports; the 8 KiB default means many small write() calls
+EXPORT_BUFFER_SIZE = 128 * 1024
+
+# Export requests within this window are flushed as a single write
+EXPORT_DEBOUNCE_MS = 500
+
+# How long transient status bar messages stay visible
+STATUS_CLEAR_MS = 3000
+
+# Row icons for every known (series, importance) pair
+_SERIES_ICONS = {
+    'TWD': '🧟‍♂️',
+    'Fear TWD': '😱',
+    'World Beyond': '🌍',
+    'Webisode': '📱',
+    'Spin-off': '🎬'
+}
+_IMPORTANCE_PREFIXES = {'Critical': '⭐ ', 'Important': '❗ '}
+_ICON_TABLE = {
+    (series, importance): _IMPORTANCE_PREFIXES.get(importance, '') + icon
+    for series, icon in _SERIES_ICONS.items()
+    for importance in ('Critical', 'Important', 'Standard', 'Optional')
+}
+
+@dataclass(slots=True, frozen=True)
 class WatchlistEntry:
-    """Represents a single entry in the chronological watchlist"""
+    """Represents a single, immutable entry in the chronological watchlist"""
     title: str
     series: str  # 'TWD', 'Fear TWD', 'World Beyond', 'Webisode', 'Spin-off'
-    season: Optional[int] = None
-    episode: Optional[int] = None
+    season: int = 0  # 0 when the entry is not a numbered episode
+    episode: int = 0
     air_date: Optional[str] = None
     timeline_date: Optional[str] = None  # In-universe date
     description: str = ""
     duration: Optional[str] = None
     is_webisode: bool = False
-    webisode_count: Optional[int] = None  # For webisode series
+    webisode_count: int = 0  # For webisode series
     importance: str = "Standard"  # 'Critical', 'Important', 'Standard', 'Optional'
     notes: str = ""
 
+@cache
+def load_watchlist() -> Tuple[WatchlistEntry, ...]:
+    """Load the watchlist data file once per process"""
+    entries = []
+    for fields in json_loads(WATCHLIST_FILE.read_bytes()):
+        # Share one string object per series/importance value across all entries
+        fields['series'] = sys.intern(fields['series'])
+        if 'importance' in fields:
+            fields['importance'] = sys.intern(fields['importance'])
+        entries.append(WatchlistEntry(**fields))
+    return tuple(entries)
+
 class TWDWatchlistGUI:
     """GUI for The Walking Dead chronological watchlist"""
     
@@ -48,6 +115,8 @@ class TWDWatchlistGUI:
         
         # Create the complete watchlist
         self.watchlist = self.create_complete_watchlist()
+        self.build_columns()
+        self.build_row_cache()
         
         # Filter variables
         self.show_webisodes = tk.BooleanVar(value=True)
@@ -55,409 +124,98 @@ class TWDWatchlistGUI:
         self.show_fear = tk.BooleanVar(value=True)
         self.show_spinoffs = tk.BooleanVar(value=True)
         self.importance_filter = tk.StringVar(value="All")
+        self._pending_refresh = None
+        self._stats_text = None
+        self._export_bytes = None
+        self._export_lock = threading.Lock()
+        self._pending_export = None
+        self._status_clear_job = None
+        self._last_export = None
         
         self.create_widgets()
+        self.populate_tree()
         self.update_watchlist_display()
         
     def create_complete_watchlist(self) -> List[WatchlistEntry]:
         """Create the complete chronological watchlist"""
-        
-        watchlist = [
-            # PRE-OUTBREAK PERIOD (2010)
-            WatchlistEntry(
-                title="Torn Apart - Episodes 1-6",
-                series="Webisode",
-                timeline_date="2010 (Pre-outbreak)",
-                description="Hannah's story - the bicycle zombie Rick encounters",
-                duration="~12 minutes total",
-                is_webisode=True,
-                webisode_count=6,
-                importance="Important",
-                notes="Sets up the bicycle zombie from TWD S1E1"
-            ),
-            
-            WatchlistEntry(
-                title="The Madman",
-                series="Webisode", 
-                timeline_date="2010 (Pre-outbreak)",
-                description="A survivor's descent into madness during early outbreak",
-                duration="~5 minutes",
-                is_webisode=True,
-                webisode_count=1,
-                importance="Optional",
-                notes="Character study of psychological breakdown"
-            ),
-            
-            # FEAR TWD BEGINS - EARLY OUTBREAK
-            WatchlistEntry(
-                title="Pilot",
-                series="Fear TWD",
-                season=1,
-                episode=1,
-                air_date="2015-08-23",
-                timeline_date="Late August 2010",
-                description="The Clark family witnesses the beginning of the outbreak",
-                importance="Critical",
-                notes="The true beginning of the outbreak timeline"
-            ),
-            
-            WatchlistEntry(
-                title="So Close, Yet So Far",
-                series="Fear TWD",
-                season=1,
-                episode=2,
-                timeline_date="Late August 2010",
-                description="The family tries to understand what's happening",
-                importance="Critical"
-            ),
-            
-            WatchlistEntry(
-                title="The Dog",
-                series="Fear TWD",
-                season=1,
-                episode=3,
-                timeline_date="Early September 2010",
-                description="Military quarantine begins",
-                importance="Critical"
-            ),
-            
-            WatchlistEntry(
-                title="Not Fade Away",
-                series="Fear TWD",
-                season=1,
-                episode=4,
-                timeline_date="September 2010",
-                description="Life under military protection",
-                importance="Critical"
-            ),
-            
-            WatchlistEntry(
-                title="Cobalt",
-                series="Fear TWD",
-                season=1,
-                episode=5,
-                timeline_date="September 2010", 
-                description="Military begins Operation Cobalt",
-                importance="Critical"
-            ),
-            
-            WatchlistEntry(
-                title="The Good Man",
-                series="Fear TWD",
-                season=1,
-                episode=6,
-                timeline_date="September 2010",
-                description="Escape from Los Angeles",
-                importance="Critical"
-            ),
-            
-            # RICK WAKES UP - TWD BEGINS
-            WatchlistEntry(
-                title="Days Gone Bye",
-                series="TWD",
-                season=1,
-                episode=1,
-                air_date="2010-10-31",
-                timeline_date="Early September 2010",
-                description="Rick awakens from coma to find the world changed",
-                importance="Critical",
-                notes="Rick's coma lasted ~60 days; outbreak started while he was unconscious"
-            ),
-            
-            WatchlistEntry(
-                title="Cold Storage - Episodes 1-4",
-                series="Webisode",
-                timeline_date="September 2010",
-                description="Chase's survival in a storage facility during early outbreak",
-                duration="~16 minutes total",
-                is_webisode=True,
-                webisode_count=4,
-                importance="Important",
-                notes="Shows civilian perspective during TWD S1 timeframe"
-            ),
-            
-            # PARALLEL STORYLINES CONTINUE
-            WatchlistEntry(
-                title="Guts",
-                series="TWD",
-                season=1,
-                episode=2,
-                timeline_date="September 2010",
-                description="Rick reaches Atlanta, meets Glenn",
-                importance="Critical"
-            ),
-            
-            WatchlistEntry(
-                title="Monster",
-                series="Fear TWD",
-                season=2,
-                episode=1,
-                timeline_date="September 2010",
-                description="The group flees on the Abigail",
-                importance="Critical",
-                notes="Happening simultaneously with early TWD episodes"
-            ),
-            
-            WatchlistEntry(
-                title="Tell It to the Frogs",
-                series="TWD",
-                season=1,
-                episode=3,
-                timeline_date="September 2010",
-                description="Rick reunites with Lori and Carl",
-                importance="Critical"
-            ),
-            
-            WatchlistEntry(
-                title="We All Fall Down",
-                series="Fear TWD",
-                season=2,
-                episode=2,
-                timeline_date="September 2010",
-                description="The group encounters the infected ship",
-                importance="Important"
-            ),
-            
-            WatchlistEntry(
-                title="Vatos",
-                series="TWD",
-                season=1,
-                episode=4,
-                timeline_date="September 2010",
-                description="Glenn is kidnapped, camp is attacked",
-                importance="Critical"
-            ),
-            
-            WatchlistEntry(
-                title="Ouroboros",
-                series="Fear TWD",
-                season=2,
-                episode=3,
-                timeline_date="September 2010",
-                description="Flight 462 passengers are rescued",
-                importance="Important",
-                notes="Connects to Flight 462 webisodes"
-            ),
-            
-            # FLIGHT 462 WEBISODES INTEGRATION
-            WatchlistEntry(
-                title="Flight 462 - Episodes 1-16",
-                series="Webisode",
-                timeline_date="September 2010",
-                description="Airplane outbreak during Fear TWD S2 events",
-                duration="~30 minutes total",
-                is_webisode=True,
-                webisode_count=16,
-                importance="Important",
-                notes="Characters appear in Fear TWD S2E3. Watch before that episode"
-            ),
-            
-            WatchlistEntry(
-                title="Wildfire",
-                series="TWD",
-                season=1,
-                episode=5,
-                timeline_date="October 2010",
-                description="Aftermath of camp attack, CDC journey",
-                importance="Critical"
-            ),
-            
-            WatchlistEntry(
-                title="TS-19",
-                series="TWD",
-                season=1,
-                episode=6,
-                timeline_date="October 2010",
-                description="CDC revelations and destruction",
-                importance="Critical",
-                notes="Dr. Jenner reveals the truth about the infection"
-            ),
-            
-            # WINTER SURVIVAL PERIOD
-            WatchlistEntry(
-                title="What Lies Ahead",
-                series="TWD",
-                season=2,
-                episode=1,
-                timeline_date="October 2010",
-                description="Highway herd, Sophia goes missing",
-                importance="Critical"
-            ),
-            
-            # Continue with Fear TWD Season 2
-            WatchlistEntry(
-                title="Blood in the Streets",
-                series="Fear TWD",
-                season=2,
-                episode=4,
-                timeline_date="October 2010",
-                description="Confrontation with Connor's group",
-                importance="Important"
-            ),
-            
-            WatchlistEntry(
-                title="Captive",
-                series="Fear TWD",
-                season=2,
-                episode=5,
-                timeline_date="October 2010",
-                description="Alicia and Travis are held captive",
-                importance="Important"
-            ),
-            
-            WatchlistEntry(
-                title="Bloodletting",
-                series="TWD",
-                season=2,
-                episode=2,
-                timeline_date="October 2010",
-                description="Carl is shot, Hershel's farm",
-                importance="Critical"
-            ),
-            
-            WatchlistEntry(
-                title="Sicut Cervus",
-                series="Fear TWD",
-                season=2,
-                episode=6,
-                timeline_date="October 2010",
-                description="Arrival in Mexico, poisoned communion",
-                importance="Important"
-            ),
-            
-            # THE OATH WEBISODES
-            WatchlistEntry(
-                title="The Oath - Episodes 1-3",
-                series="Webisode",
-                timeline_date="October-November 2010",
-                description="Medical facility breakdown during early outbreak",
-                duration="~12 minutes total", 
-                is_webisode=True,
-                webisode_count=3,
-                importance="Important",
-                notes="Shows medical perspective during TWD S2 timeframe"
-            ),
-            
-            # Continue TWD Season 2
-            WatchlistEntry(
-                title="Save the Last One",
-                series="TWD",
-                season=2,
-                episode=3,
-                timeline_date="November 2010",
-                description="Shane and Otis at the high school",
-                importance="Critical"
-            ),
-            
-            # SKIP AHEAD TO CRITICAL INTEGRATION POINTS...
-            # Adding key episodes where timelines intersect
-            
-            # FEAR TWD CATCHES UP TO TWD TIMELINE (Season 4-5)
-            WatchlistEntry(
-                title="What's Your Story?",
-                series="Fear TWD",
-                season=4,
-                episode=1,
-                timeline_date="Spring 2012",
-                description="Morgan crosses over from TWD",
-                importance="Critical",
-                notes="Direct connection to TWD timeline - Morgan appears"
-            ),
-            
-            # PASSAGE WEBISODES (2016 timeline)
-            WatchlistEntry(
-                title="Passage - Episodes 1-10",
-                series="Webisode",
-                timeline_date="2016 (6-year time jump period)",
-                description="Mother and daughter survival story",
-                duration="~20 minutes total",
-                is_webisode=True,
-                webisode_count=10,
-                importance="Important",
-                notes="Takes place during the 6-year time jump between TWD S8 and S9"
-            ),
-            
-            # RED MACHETE WEBISODES (Multiple time periods)
-            WatchlistEntry(
-                title="Red Machete - Episodes 1-16",
-                series="Webisode",
-                timeline_date="2010-2017 (Multiple periods)",
-                description="A machete's journey through different survivor groups",
-                duration="~32 minutes total",
-                is_webisode=True,
-                webisode_count=16,
-                importance="Important",
-                notes="Spans multiple time periods, connects to main show events"
-            ),
-            
-            # WORLD BEYOND INTEGRATION
-            WatchlistEntry(
-                title="Brave",
-                series="World Beyond",
-                season=1,
-                episode=1,
-                timeline_date="2020 (10 years after outbreak)",
-                description="The next generation's story begins",
-                importance="Important",
-                notes="Shows the wider world 10 years later"
-            ),
-            
-            # THE ALTHEA TAPES
-            WatchlistEntry(
-                title="The Althea Tapes - Episodes 1-2",
-                series="Webisode",
-                timeline_date="2018-2019",
-                description="Lost footage from Althea's documentary work",
-                duration="~8 minutes total",
-                is_webisode=True,
-                webisode_count=2,
-                importance="Optional",
-                notes="Character study for Fear TWD's Althea"
-            ),
-            
-            # FINAL WEBISODE
-            WatchlistEntry(
-                title="Dead in the Water",
-                series="Webisode",
-                timeline_date="2022",
-                description="Submarine crew's final stand",
-                duration="~6 minutes",
-                is_webisode=True,
-                webisode_count=1,
-                importance="Optional",
-                notes="Final chronological webisode, post-main series"
-            ),
-            
-            # SPIN-OFFS (Post main series)
-            WatchlistEntry(
-                title="Dead City",
-                series="Spin-off",
-                timeline_date="2023+",
-                description="Negan and Maggie in Manhattan",
-                importance="Important",
-                notes="Post-TWD finale spin-off"
-            ),
+        return list(load_watchlist())
+    
+    def build_columns(self):
+        """Build parallel per-field columns so filter and statistics scans touch only what they need"""
+        self.series_col = tuple(e.series for e in self.watchlist)
+        self.importance_col = tuple(e.importance for e in self.watchlist)
+        self.is_webisode_col = tuple(e.is_webisode for e in self.watchlist)
+        self.webisode_count_col = tuple(e.webisode_count for e in self.watchlist)
+        
+        # Index sets per series and importance, combined with set operations when filtering
+        self.by_series = {}
+        self.by_importance = {}
+        for i, (series, importance) in enumerate(zip(self.series_col, self.importance_col)):
+            self.by_series.setdefault(series, set()).add(i)
+            self.by_importance.setdefault(importance, set()).add(i)
+        
+        # Small-int category codes so filters become vectorized comparisons
+        if np is not None:
+            self.series_codes_map = {series: code for code, series in enumerate(self.by_series)}
+            self.importance_codes_map = {importance: code for code, importance in enumerate(self.by_importance)}
+            self.series_codes = np.fromiter((self.series_codes_map[s] for s in self.series_col),
+                                            dtype=np.int8, count=len(self.series_col))
+            self.importance_codes = np.fromiter((self.importance_codes_map[i] for i in self.importance_col),
+                                                dtype=np.int8, count=len(self.importance_col))
+    
+    def build_row_cache(self):
+        """Format every Treeview row once; the data never changes after construction"""
+        self.row_cache = []
+        for entry in self.watchlist:
+            # Format season/episode
+            if entry.season:
+                season_ep = f"S{entry.season:02d}E{entry.episode:02d}"
+            elif entry.is_webisode and entry.webisode_count:
+                season_ep = f"Web x{entry.webisode_count}"
+            else:
+                season_ep = "Special"
             
-            WatchlistEntry(
-                title="Daryl Dixon",
-                series="Spin-off",
-                timeline_date="2023+",
-                description="Daryl's adventures in France",
-                importance="Important",
-                notes="Post-TWD finale spin-off"
-            ),
+            # Title with appropriate icon
+            icon = self.get_series_icon(entry.series, entry.importance)
+            title_with_icon = f"{icon} {entry.title}"
             
-            WatchlistEntry(
-                title="The Ones Who Live",
-                series="Spin-off",
-                timeline_date="2023+",
-                description="Rick and Michonne's story continues",
-                importance="Critical",
-                notes="Resolves Rick's story from TWD finale"
-            ),
-        ]
-        
-        return watchlist
+            values = (entry.series, season_ep, entry.timeline_date or "Unknown",
+                      entry.duration or "~45min", entry.importance)
+            self.row_cache.append((title_with_icon, values, (entry.importance.lower(),)))
+    
+    def build_export_payload(self) -> bytes:
+        """Serialize the export records; the row dicts are dropped once encoded"""
+        # Bind the key tuple and getter locally so the loop avoids global lookups
+        keys, getter = _EXPORT_KEYS, _EXPORT_GET
+        records = [dict(zip(keys, getter(entry))) for entry in self.watchlist]
+        
+        # Unset numeric fields are stored as 0 but exported as null
+        for record in records:
+            for key in _EXPORT_NULLABLE_KEYS:
+                record[key] = record[key] or None
+        
+        if orjson_dumps is not None:
+            return orjson_dumps(records, option=OPT_INDENT_2)
+        return json.dumps(records, indent=2, ensure_ascii=False).encode('utf-8')
+    
+    def filter_indices(self, hidden_series: set, importance_filter: str) -> List[int]:
+        """Return the chronologically ordered indices of entries passing the filters"""
+        if np is not None:
+            hidden_codes = [self.series_codes_map[s] for s in hidden_series if s in self.series_codes_map]
+            mask = ~np.isin(self.series_codes, hidden_codes)
+            if importance_filter != "All":
+                mask &= self.importance_codes == self.importance_codes_map.get(importance_filter, -1)
+            return np.flatnonzero(mask).tolist()
+        
+        visible = set()
+        for series, indices in self.by_series.items():
+            if series not in hidden_series:
+                visible |= indices
+        
+        if importance_filter != "All":
+            visible &= self.by_importance.get(importance_filter, set())
+        
+        return sorted(visible)
     
     def create_widgets(self):
         """Create and layout GUI widgets"""
@@ -489,13 +247,13 @@ class TWDWatchlistGUI:
         
         # Filter checkboxes
         ttk.Checkbutton(filter_frame, text="📺 Main TWD Episodes", 
-                       variable=self.show_twd, command=self.update_watchlist_display).grid(row=0, column=0, sticky=tk.W, padx=(0, 20))
+                       variable=self.show_twd, command=self._schedule_refresh).grid(row=0, column=0, sticky=tk.W, padx=(0, 20))
         ttk.Checkbutton(filter_frame, text="😨 Fear TWD Episodes", 
-                       variable=self.show_fear, command=self.update_watchlist_display).grid(row=0, column=1, sticky=tk.W, padx=(0, 20))
+                       variable=self.show_fear, command=self._schedule_refresh).grid(row=0, column=1, sticky=tk.W, padx=(0, 20))
         ttk.Checkbutton(filter_frame, text="🌐 Webisodes", 
-                       variable=self.show_webisodes, command=self.update_watchlist_display).grid(row=0, column=2, sticky=tk.W, padx=(0, 20))
+                       variable=self.show_webisodes, command=self._schedule_refresh).grid(row=0, column=2, sticky=tk.W, padx=(0, 20))
         ttk.Checkbutton(filter_frame, text="🎬 Spin-offs", 
-                       variable=self.show_spinoffs, command=self.update_watchlist_display).grid(row=0, column=3, sticky=tk.W, padx=(0, 20))
+                       variable=self.show_spinoffs, command=self._schedule_refresh).grid(row=0, column=3, sticky=tk.W, padx=(0, 20))
         
         # Importance filter
         ttk.Label(filter_frame, text="Importance:").grid(row=1, column=0, sticky=tk.W, pady=(10, 0))
@@ -503,7 +261,7 @@ class TWDWatchlistGUI:
                                        values=["All", "Critical", "Important", "Standard", "Optional"],
                                        state="readonly")
         importance_combo.grid(row=1, column=1, sticky=tk.W, pady=(10, 0))
-        importance_combo.bind('<<ComboboxSelected>>', lambda e: self.update_watchlist_display())
+        importance_combo.bind('<<ComboboxSelected>>', lambda e: self._schedule_refresh())
         
         # Action buttons
         button_frame = ttk.Frame(filter_frame)
@@ -539,12 +297,12 @@ class TWDWatchlistGUI:
         self.tree.column('Importance', width=100)
         
         # Scrollbars
-        v_scrollbar = ttk.Scrollbar(list_frame, orient="vertical", command=self.tree.yview)
+        self.v_scrollbar = ttk.Scrollbar(list_frame, orient="vertical", command=self.tree.yview)
         h_scrollbar = ttk.Scrollbar(list_frame, orient="horizontal", command=self.tree.xview)
-        self.tree.configure(yscrollcommand=v_scrollbar.set, xscrollcommand=h_scrollbar.set)
+        self.tree.configure(yscrollcommand=self._on_tree_yscroll, xscrollcommand=h_scrollbar.set)
         
         self.tree.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
-        v_scrollbar.grid(row=0, column=1, sticky=(tk.N, tk.S))
+        self.v_scrollbar.grid(row=0, column=1, sticky=(tk.N, tk.S))
         h_scrollbar.grid(row=1, column=0, sticky=(tk.W, tk.E))
         
         # Bind double-click to show details
@@ -553,82 +311,99 @@ class TWDWatchlistGUI:
         # Status bar
         self.status_label = ttk.Label(main_frame, text="Ready")
         self.status_label.grid(row=4, column=0, sticky=tk.W, pady=(10, 0))
-    
-    def update_watchlist_display(self):
-        """Update the watchlist display based on filters"""
-        # Clear existing items
-        for item in self.tree.get_children():
-            self.tree.delete(item)
         
-        # Filter watchlist
-        filtered_list = []
-        for entry in self.watchlist:
-            # Series filter
-            if entry.series == "TWD" and not self.show_twd.get():
-                continue
-            if entry.series == "Fear TWD" and not self.show_fear.get():
-                continue
-            if entry.series == "Webisode" and not self.show_webisodes.get():
-                continue
-            if entry.series in ["World Beyond", "Spin-off"] and not self.show_spinoffs.get():
-                continue
-            
-            # Importance filter
-            if self.importance_filter.get() != "All" and entry.importance != self.importance_filter.get():
-                continue
-                
-            filtered_list.append(entry)
-        
-        # Add filtered items to tree
-        for i, entry in enumerate(filtered_list):
-            # Format season/episode
-            if entry.season and entry.episode:
-                season_ep = f"S{entry.season:02d}E{entry.episode:02d}"
-            elif entry.is_webisode and entry.webisode_count:
-                season_ep = f"Web x{entry.webisode_count}"
-            else:
-                season_ep = "Special"
-            
-            # Add item with appropriate icon
-            icon = self.get_series_icon(entry.series, entry.importance)
-            title_with_icon = f"{icon} {entry.title}"
-            
-            self.tree.insert('', 'end', 
-                           text=title_with_icon,
-                           values=(entry.series, season_ep, entry.timeline_date or "Unknown", 
-                                 entry.duration or "~45min", entry.importance),
-                           tags=(entry.importance.lower(),))
+        # Transient messages such as export results, shown without a modal dialog
+        self.status_var = tk.StringVar(value="")
+        ttk.Label(main_frame, textvariable=self.status_var).grid(row=4, column=0, sticky=tk.E, pady=(10, 0))
+    
+    def populate_tree(self):
+        """Set up lazy row insertion; rows are created in chunks as they scroll into view"""
+        self._created = set()
+        self._visible_rows = []
+        self._attached_count = 0
+        self._load_pending = False
         
         # Configure tag colors
         self.tree.tag_configure('critical', background='#ffeeee')
         self.tree.tag_configure('important', background='#fffacd')  
         self.tree.tag_configure('optional', background='#f0f8ff')
+    
+    def _show_row(self, i: int, index):
+        """Attach row i at index, inserting it into the Treeview on first use"""
+        if i in self._created:
+            self.tree.move(str(i), '', index)
+        else:
+            text, values, tags = self.row_cache[i]
+            self.tree.insert('', index, iid=str(i), text=text, values=values, tags=tags)
+            self._created.add(i)
+    
+    def load_more_rows(self):
+        """Attach the next chunk of filtered rows below the ones already shown"""
+        self._load_pending = False
+        start = self._attached_count
+        for i in self._visible_rows[start:start + TREE_CHUNK_SIZE]:
+            self._show_row(i, 'end')
+        self._attached_count = min(start + TREE_CHUNK_SIZE, len(self._visible_rows))
+    
+    def _on_tree_yscroll(self, first, last):
+        """Update the scrollbar and load more rows once the view nears the bottom"""
+        self.v_scrollbar.set(first, last)
+        if (float(last) > 0.9 and not self._load_pending
+                and self._attached_count < len(self._visible_rows)):
+            self._load_pending = True
+            self.root.after_idle(self.load_more_rows)
+    
+    def _schedule_refresh(self):
+        """Coalesce bursts of filter changes into a single display update"""
+        if self._pending_refresh is not None:
+            self.root.after_cancel(self._pending_refresh)
+        self._pending_refresh = self.root.after(75, self.update_watchlist_display)
+    
+    def update_watchlist_display(self):
+        """Update the watchlist display based on filters"""
+        self._pending_refresh = None
+        
+        # Filter watchlist using the precomputed series and importance columns
+        hidden_series = set()
+        if not self.show_twd.get():
+            hidden_series.add("TWD")
+        if not self.show_fear.get():
+            hidden_series.add("Fear TWD")
+        if not self.show_webisodes.get():
+            hidden_series.add("Webisode")
+        if not self.show_spinoffs.get():
+            hidden_series.update(("World Beyond", "Spin-off"))
+        
+        visible = self.filter_indices(hidden_series, self.importance_filter.get())
+        
+        # Only the first chunk is attached; the rest loads on scroll.
+        # Rows whose visibility did not change are left untouched.
+        shown = visible[:TREE_CHUNK_SIZE]
+        attached = set(self._visible_rows[:self._attached_count])
+        new_attached = set(shown)
+        hidden = attached - new_attached
+        if hidden:
+            self.tree.detach(*(str(i) for i in hidden))
+        
+        # Attach in ascending order so each lands at its chronological position
+        for i in sorted(new_attached - attached):
+            self._show_row(i, bisect_left(shown, i))
+        self._visible_rows = visible
+        self._attached_count = len(shown)
         
         # Update status
-        total_shown = len(filtered_list)
-        total_episodes = sum(1 for e in filtered_list if not e.is_webisode)
-        total_webisodes = sum(e.webisode_count or 1 for e in filtered_list if e.is_webisode)
+        total_shown = len(visible)
+        total_episodes = sum(1 for i in visible if not self.is_webisode_col[i])
+        total_webisodes = sum(self.webisode_count_col[i] or 1 for i in visible if self.is_webisode_col[i])
         
         self.status_label.config(text=f"Showing {total_shown} entries | {total_episodes} episodes | {total_webisodes} webisode segments")
     
     def get_series_icon(self, series: str, importance: str) -> str:
         """Get appropriate icon for series and importance"""
-        icons = {
-            'TWD': '🧟‍♂️',
-            'Fear TWD': '😱', 
-            'World Beyond': '🌍',
-            'Webisode': '📱',
-            'Spin-off': '🎬'
-        }
-        
-        base_icon = icons.get(series, '📺')
-        
-        if importance == 'Critical':
-            return f"⭐ {base_icon}"
-        elif importance == 'Important':
-            return f"❗ {base_icon}"
-        else:
-            return base_icon
+        icon = _ICON_TABLE.get((series, importance))
+        if icon is None:
+            icon = _IMPORTANCE_PREFIXES.get(importance, '') + _SERIES_ICONS.get(series, '📺')
+        return icon
     
     def show_episode_details(self, event):
         """Show detailed information about selected episode"""
@@ -636,19 +411,8 @@ class TWDWatchlistGUI:
         if not selection:
             return
             
-        # Find the corresponding entry
-        item_text = self.tree.item(selection[0])['text']
-        # Remove icon from title for matching
-        clean_title = item_text.split(' ', 1)[1] if ' ' in item_text else item_text
-        
-        entry = None
-        for e in self.watchlist:
-            if clean_title.startswith(e.title):
-                entry = e
-                break
-        
-        if not entry:
-            return
+        # Rows are inserted with their watchlist index as the item id
+        entry = self.watchlist[int(selection[0])]
         
         # Create detail window
         detail_window = tk.Toplevel(self.root)
@@ -669,7 +433,7 @@ class TWDWatchlistGUI:
         ttk.Label(info_frame, text="Series:").grid(row=0, column=0, sticky=tk.W, padx=(0, 10))
         ttk.Label(info_frame, text=entry.series).grid(row=0, column=1, sticky=tk.W)
         
-        if entry.season and entry.episode:
+        if entry.season:
             ttk.Label(info_frame, text="Season/Episode:").grid(row=1, column=0, sticky=tk.W, padx=(0, 10))
             ttk.Label(info_frame, text=f"Season {entry.season}, Episode {entry.episode}").grid(row=1, column=1, sticky=tk.W)
         
@@ -691,29 +455,21 @@ class TWDWatchlistGUI:
             desc_text.insert(tk.END, f"\n\nNotes: {entry.notes}")
         desc_text.config(state=tk.DISABLED)
     
-    def show_statistics(self):
-        """Show viewing statistics"""
-        stats_window = tk.Toplevel(self.root)
-        stats_window.title("Watchlist Statistics")
-        stats_window.geometry("500x400")
-        
-        stats_frame = ttk.Frame(stats_window, padding="20")
-        stats_frame.pack(fill=tk.BOTH, expand=True)
-        
+    def build_stats_text(self) -> str:
+        """Build the statistics report text"""
         # Calculate statistics
         total_entries = len(self.watchlist)
-        twd_count = len([e for e in self.watchlist if e.series == "TWD"])
-        fear_count = len([e for e in self.watchlist if e.series == "Fear TWD"])
-        webisode_entries = [e for e in self.watchlist if e.is_webisode]
-        webisode_count = len(webisode_entries)
-        webisode_segments = sum(e.webisode_count or 1 for e in webisode_entries)
-        spinoff_count = len([e for e in self.watchlist if e.series in ["World Beyond", "Spin-off"]])
-        
-        critical_count = len([e for e in self.watchlist if e.importance == "Critical"])
-        important_count = len([e for e in self.watchlist if e.importance == "Important"])
-        
-        # Display statistics
-        ttk.Label(stats_frame, text="📊 Watchlist Statistics", font=('Arial', 14, 'bold')).pack(pady=(0, 20))
+        series_counts = Counter(self.series_col)
+        importance_counts = Counter(self.importance_col)
+        twd_count = series_counts["TWD"]
+        fear_count = series_counts["Fear TWD"]
+        webisode_count = sum(self.is_webisode_col)
+        webisode_segments = sum(count or 1 for count, is_webisode
+                                in zip(self.webisode_count_col, self.is_webisode_col) if is_webisode)
+        spinoff_count = series_counts["World Beyond"] + series_counts["Spin-off"]
+        
+        critical_count = importance_counts["Critical"]
+        important_count = importance_counts["Important"]
         
         stats_text = f"""
 🎬 Total Entries: {total_entries}
@@ -736,39 +492,89 @@ class TWDWatchlistGUI:
 
 🎯 Total Viewing Time: 300+ hours
 """
+        return stats_text
+    
+    def show_statistics(self):
+        """Show viewing statistics"""
+        stats_window = tk.Toplevel(self.root)
+        stats_window.title("Watchlist Statistics")
+        stats_window.geometry("500x400")
+        
+        stats_frame = ttk.Frame(stats_window, padding="20")
+        stats_frame.pack(fill=tk.BOTH, expand=True)
+        
+        # Computed once; the watchlist never changes after construction
+        if self._stats_text is None:
+            self._stats_text = self.build_stats_text()
+        
+        # Display statistics
+        ttk.Label(stats_frame, text="📊 Watchlist Statistics", font=('Arial', 14, 'bold')).pack(pady=(0, 20))
         
         text_widget = scrolledtext.ScrolledText(stats_frame, wrap=tk.WORD, font=('Courier', 10))
         text_widget.pack(fill=tk.BOTH, expand=True)
-        text_widget.insert(tk.END, stats_text)
+        text_widget.insert(tk.END, self._stats_text)
         text_widget.config(state=tk.DISABLED)
     
     def export_watchlist(self):
-        """Export watchlist to JSON file"""
-        try:
-            export_data = []
-            for entry in self.watchlist:
-                export_data.append({
-                    'title': entry.title,
-                    'series': entry.series,
-                    'season': entry.season,
-                    'episode': entry.episode,
-                    'timeline_date': entry.timeline_date,
-                    'description': entry.description,
-                    'duration': entry.duration,
-                    'is_webisode': entry.is_webisode,
-                    'webisode_count': entry.webisode_count,
-                    'importance': entry.importance,
-                    'notes': entry.notes
-                })
-            
-            export_file = Path("twd_chronological_watchlist.json")
-            with open(export_file, 'w', encoding='utf-8') as f:
-                json.dump(export_data, f, indent=2, ensure_ascii=False)
-            
-            messagebox.showinfo("Export Complete", f"Watchlist exported to {export_file}")
-            
-        except Exception as e:
-            messagebox.showerror("Export Error", f"Failed to export watchlist: {e}")
+        """Export watchlist to JSON file; repeated requests are batched into one write"""
+        if self._pending_export is None:
+            self._pending_export = self.root.after(EXPORT_DEBOUNCE_MS, self._flush_export)
+    
+    def _flush_export(self):
+        """Write the pending export in the background"""
+        self._pending_export = None
+        export_file = Path("twd_chronological_watchlist.json")
+        threading.Thread(target=self._export_worker, args=(export_file,), daemon=True).start()
+    
+    def _export_worker(self, export_file: Path):
+        """Encode and write the export off the Tk thread, then report back on it"""
+        with self._export_lock:
+            # The watchlist never changes, so encode it on first export only
+            if self._export_bytes is None:
+                try:
+                    self._export_bytes = self.build_export_payload()
+                except (TypeError, ValueError) as e:
+                    self.root.after(0, messagebox.showerror, "Export Error", f"Failed to encode watchlist: {e}")
+                    return
+            
+            # Skip the write when this exact payload is already on disk, untouched since
+            digest = blake2b(self._export_bytes, digest_size=16).digest()
+            target = export_file.resolve()
+            if self._last_export is not None and self._last_export[:2] == (target, digest):
+                try:
+                    stat = target.stat()
+                except OSError:
+                    stat = None
+                if stat is not None and (stat.st_size, stat.st_mtime_ns) == self._last_export[2]:
+                    self.root.after(0, self.show_status, f"✅ {export_file} is already up to date")
+                    return
+            
+            # Write a sibling temp file and rename it over the target, so a
+            # crash mid-write never leaves a truncated export behind
+            tmp_file = export_file.with_suffix('.json.tmp')
+            try:
+                with open(tmp_file, 'wb', buffering=EXPORT_BUFFER_SIZE) as f:
+                    f.write(self._export_bytes)
+                os.replace(tmp_file, export_file)
+                stat = target.stat()
+            except OSError as e:
+                self.root.after(0, messagebox.showerror, "Export Error", f"Failed to export watchlist: {e}")
+                return
+            self._last_export = (target, digest, (stat.st_size, stat.st_mtime_ns))
+        
+        self.root.after(0, self.show_status, f"✅ Watchlist exported to {export_file}")
+    
+    def show_status(self, message: str):
+        """Show a transient status bar message that clears itself after a few seconds"""
+        self.status_var.set(message)
+        if self._status_clear_job is not None:
+            self.root.after_cancel(self._status_clear_job)
+        self._status_clear_job = self.root.after(STATUS_CLEAR_MS, self._clear_status)
+    
+    def _clear_status(self):
+        """Remove the transient status bar message"""
+        self._status_clear_job = None
+        self.status_var.set("")
 
 def main():
     """Main function to run the watchlist GUI"""
@@ -24,15 +24,35 @@ import subprocess
 import json
 import time
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from pathlib import Path
 import yt_dlp
 from dataclasses import dataclass, asdict
 from typing import Dict, List, Optional, Tuple, Any
 import logging
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import cache
+from operator import attrgetter
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait, FIRST_COMPLETED
+from collections import defaultdict, deque
 import re
 from urllib.parse import urlparse
 import random
+import importlib.util
+import os
+import shelve
+import shutil
+import socket
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
 
 # Configure logging
 logging.basicConfig(
@@ -45,7 +65,7 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-@dataclass
+@dataclass(slots=True)
 class WebisodeSource:
     """Represents a download source for a webisode"""
     url: str
@@ -54,7 +74,7 @@ class WebisodeSource:
     priority: int = 1  # Lower number = higher priority
     working: Optional[bool] = None  # Track if this source is working
 
-@dataclass
+@dataclass(slots=True)
 class Webisode:
     """Represents a single webisode with multiple sources"""
     title: str
@@ -65,22 +85,224 @@ class Webisode:
     duration: Optional[str] = None
     year: Optional[int] = None
 
+# Webisode catalog with chronological order and sources, shipped alongside this module
+WEBISODES_FILE = Path(__file__).with_name("twd_webisodes.json")
+
+@cache
+def load_webisode_catalog() -> Tuple[Dict[str, Any], ...]:
+    """Read the webisode catalog file once per process"""
+    return tuple(json_loads(WEBISODES_FILE.read_bytes()))
+
+# Sort key for trying sources in priority order
+_PRIORITY = attrgetter('priority')
+
+# One long-lived metadata-only extractor shared by source probes and YouTube searches
+_PROBE_YDL = None
+_PROBE_LOCK = threading.Lock()
+
+def probe_extract(url: str) -> Optional[Dict[str, Any]]:
+    """Extract metadata with the shared extractor; playlist and search entries stay unresolved"""
+    global _PROBE_YDL
+    with _PROBE_LOCK:
+        if _PROBE_YDL is None:
+            _PROBE_YDL = yt_dlp.YoutubeDL({
+                'quiet': True,
+                'no_warnings': True,
+                'extract_flat': 'in_playlist',
+                'socket_timeout': 10,
+            })
+        return _PROBE_YDL.extract_info(url, download=False)
+
+def close_probe_extractor():
+    """Release the shared extractor and its connections"""
+    global _PROBE_YDL
+    with _PROBE_LOCK:
+        if _PROBE_YDL is not None:
+            _PROBE_YDL.close()
+            _PROBE_YDL = None
+
+# Resolved addresses are reused for this long, so new connections to a known host skip DNS
+DNS_CACHE_TTL = 300
+
+def install_dns_cache(ttl: float = DNS_CACHE_TTL):
+    """Wrap socket.getaddrinfo with a process-wide cache of successful lookups"""
+    if getattr(socket.getaddrinfo, 'dns_cached', False):
+        return
+    resolve = socket.getaddrinfo
+    cache = {}
+    lock = threading.Lock()
+    
+    def getaddrinfo(host, port, family=0, type=0, proto=0, flags=0):
+        key = (host, port, family, type, proto, flags)
+        now = time.monotonic()
+        with lock:
+            entry = cache.get(key)
+        if entry and now - entry[0] < ttl:
+            return list(entry[1])
+        
+        # Failed lookups raise and are not cached
+        result = resolve(host, port, family, type, proto, flags)
+        with lock:
+            cache[key] = (now, tuple(result))
+        return result
+    
+    getaddrinfo.dns_cached = True
+    socket.getaddrinfo = getaddrinfo
+
+def drop_page_cache(path: str):
+    """Evict a finished download from the page cache; it is rarely re-read right away"""
+    if not hasattr(os, 'posix_fadvise'):
+        return
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        # Only clean pages can be dropped, so flush the data first
+        os.fdatasync(fd)
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+    except OSError as e:
+        logger.debug(f"Could not drop page cache for {path}: {e}")
+    finally:
+        os.close(fd)
+
+# Network errors raised by whichever HTTP client is in use
+REQUEST_ERRORS = (requests.RequestException,) + ((httpx.HTTPError,) if httpx is not None else ())
+
+# Source types whose reachability can be checked with a HEAD request
+HEAD_PROBE_SOURCE_TYPES = ('archive', 'amc', 'dailymotion')
+
+# Persistent record of sources that recently worked or failed; dead ones are retried sooner
+PROBE_CACHE_FILE = Path(os.environ.get('XDG_CACHE_HOME', Path.home() / '.cache')) / 'twd' / 'probe.db'
+PROBE_CACHE_TTL = 7 * 24 * 3600
+DEAD_SOURCE_TTL = 3600
+
+# How long and how many search results are kept for reuse across query variations
+SEARCH_CACHE_TTL = 3600
+SEARCH_CACHE_SIZE = 256
+
+# How often queued progress updates and log lines are written to their widgets
+PROGRESS_FLUSH_MS = 50
+PROGRESS_MIN_STEP = 0.25  # Percent
+LOG_FLUSH_MS = 50
+
+# Oldest log lines are dropped beyond this many
+LOG_MAX_LINES = 2000
+
+# Download error text that identifies failures worth retrying and ones that are not
+TRANSIENT_FAILURE_MARKERS = ('http error 429', 'too many requests', 'timed out', 'timeout',
+                             'temporar', 'connection reset', 'http error 5')
+PERMANENT_FAILURE_MARKERS = ('http error 404', 'http error 410', 'not found', 'unavailable',
+                             'private video', 'has been removed', 'unsupported url', 'no video formats')
+
+# Pause before moving on to the next source of a webisode; same-source retries back off instead
+SOURCE_SWITCH_DELAY = 1.0
+ALTERNATIVE_SWITCH_DELAY = 2.0
+
+# yt-dlp read buffer and HTTP range size for native downloads
+DOWNLOAD_BUFFER_SIZE = 1 << 20
+DOWNLOAD_CHUNK_SIZE = 10 << 20
+
+# Concurrent webisode downloads: default and hard upper bound for the Max Workers setting
+DEFAULT_MAX_WORKERS = 4
+MAX_DOWNLOAD_WORKERS = 8
+
+# aria2c, when installed, fetches plain HTTP(S) downloads as parallel ranged segments
+ARIA2C_PATH = shutil.which('aria2c')
+DEFAULT_SEGMENTS = 8
+
 class AlternativeSourceFinder:
     """Finds alternative download sources for failed webisodes"""
     
+    # Titles mentioning any of these are considered TWD-related
+    _TWD_KEYWORDS_RE = re.compile(
+        r"walking dead|twd|webisode|torn apart|cold storage|the oath|red machete|"
+        r"flight 462|passage|althea|madman|dead in the water|fear",
+        re.IGNORECASE
+    )
+    
+    # Priority given to alternatives by where they were found (Internet Archive first)
+    _ALTERNATIVE_PRIORITIES = {'archive': 1, 'youtube': 2}
+    
+    # Stop searching further query variations once this many alternatives are found
+    _MAX_ALTERNATIVES = 8
+    
     def __init__(self):
+        self.retry_count = 0
+        self.max_retries = 3
+        
         self.session = requests.Session()
         self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+            'Connection': 'keep-alive'
         })
-        self.retry_count = 0
-        self.max_retries = 3
         
+        # Pool keep-alive connections and retry transient server errors with backoff
+        retry = Retry(total=self.max_retries, backoff_factor=1,
+                      status_forcelist=[500, 502, 503, 504], allowed_methods=["GET", "HEAD"])
+        adapter = HTTPAdapter(pool_connections=20, pool_maxsize=20, max_retries=retry)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        
+        # Archive.org searches fan out across threads; with HTTP/2 they all multiplex
+        # over one connection instead of opening one per strategy
+        if httpx is not None and importlib.util.find_spec('h2') is not None:
+            self.search_client = httpx.Client(
+                headers={'User-Agent': self.session.headers['User-Agent']},
+                transport=httpx.HTTPTransport(
+                    http2=True,
+                    retries=self.max_retries,
+                    limits=httpx.Limits(max_connections=100, max_keepalive_connections=20)
+                )
+            )
+        else:
+            self.search_client = self.session
+        
+        # Search results keyed by (source, normalized query), shared across webisodes
+        self._search_cache = {}
+        self._search_cache_lock = threading.Lock()
+        
+    def close(self):
+        """Close pooled connections held by the HTTP clients"""
+        if self.search_client is not self.session:
+            self.search_client.close()
+        self.session.close()
+    
     def exponential_backoff(self, attempt: int, base_delay: float = 1.0) -> float:
         """Calculate exponential backoff delay"""
         return base_delay * (2 ** attempt) + random.uniform(0, 1)
     
+    @staticmethod
+    def _normalize_query(query: str) -> str:
+        """Case- and whitespace-insensitive form of a search query"""
+        return ' '.join(query.lower().split())
+    
+    def _cached_search(self, kind: str, query: str, search_func) -> List[str]:
+        """Return recent results for an equivalent query, or run the search and remember them"""
+        key = (kind, self._normalize_query(query))
+        now = time.monotonic()
+        with self._search_cache_lock:
+            cached = self._search_cache.get(key)
+        if cached and now - cached[0] < SEARCH_CACHE_TTL:
+            logger.info(f"Using cached {kind} results for '{query}'")
+            return list(cached[1])
+        
+        urls = search_func(query)
+        
+        # Empty results may be a transient failure, so only successes are cached
+        if urls:
+            with self._search_cache_lock:
+                if len(self._search_cache) >= SEARCH_CACHE_SIZE:
+                    oldest = min(self._search_cache, key=lambda k: self._search_cache[k][0])
+                    del self._search_cache[oldest]
+                self._search_cache[key] = (now, tuple(urls))
+        return urls
+    
     def search_archive_org(self, query: str) -> List[str]:
+        """Search Archive.org for alternative sources, reusing recent results"""
+        return self._cached_search('archive', query, self._search_archive_org)
+    
+    def _search_archive_org(self, query: str) -> List[str]:
         """Search Archive.org for alternative sources with enhanced strategies"""
         urls = []
         
@@ -113,91 +335,89 @@ class AlternativeSourceFinder:
             }
         ]
         
-        for strategy in search_strategies:
-            try:
-                for attempt in range(self.max_retries):
-                    try:
-                        search_url = "https://archive.org/advancedsearch.php"
-                        params = {
-                            'q': strategy['q'],
-                            'fl': 'identifier,title,description,creator',
-                            'rows': 15,
-                            'output': 'json',
-                            'sort': 'downloads desc'  # Sort by popularity
-                        }
-                        
-                        logger.info(f"Archive.org search attempt {attempt + 1}: {strategy['description']}")
-                        
-                        response = self.session.get(search_url, params=params, timeout=15)
-                        if response.status_code == 200:
-                            data = response.json()
-                            for item in data.get('response', {}).get('docs', []):
-                                identifier = item.get('identifier')
-                                title = item.get('title', '')
-                                if identifier and self._is_relevant_result(query, title):
-                                    archive_url = f"https://archive.org/details/{identifier}"
-                                    if archive_url not in urls:
-                                        urls.append(archive_url)
-                                        logger.info(f"Found Archive.org match: {title} -> {identifier}")
-                            break  # Success, no need to retry this strategy
-                        else:
-                            logger.warning(f"Archive.org returned {response.status_code}")
-                            if attempt < self.max_retries - 1:
-                                delay = self.exponential_backoff(attempt)
-                                logger.info(f"Retrying in {delay:.1f} seconds...")
-                                time.sleep(delay)
-                    except requests.RequestException as e:
-                        logger.warning(f"Archive.org request failed (attempt {attempt + 1}): {e}")
-                        if attempt < self.max_retries - 1:
-                            delay = self.exponential_backoff(attempt)
-                            time.sleep(delay)
-                        
-            except Exception as e:
-                logger.warning(f"Archive.org search strategy '{strategy['description']}' failed: {e}")
-                continue
+        # Strategies are independent requests, so run them concurrently over the pooled session
+        with ThreadPoolExecutor(max_workers=len(search_strategies)) as executor:
+            futures = [executor.submit(self._run_archive_strategy, query, strategy)
+                       for strategy in search_strategies]
             
-            # Limit total results per strategy
-            if len(urls) >= 20:
-                break
+            # Merge in strategy order so results stay ranked the same way
+            for future in futures:
+                for archive_url in future.result():
+                    if archive_url not in urls:
+                        urls.append(archive_url)
+                
+                # Limit total results across strategies; the remaining requests are already
+                # in flight, so their results are simply not merged
+                if len(urls) >= 20:
+                    break
                 
         logger.info(f"Archive.org search completed: found {len(urls)} potential matches for '{query}'")
         return urls[:10]  # Return top 10 matches
     
+    def _run_archive_strategy(self, query: str, strategy: Dict[str, str]) -> List[str]:
+        """Run a single Archive.org search strategy and return relevant item URLs"""
+        urls = []
+        try:
+            search_url = "https://archive.org/advancedsearch.php"
+            params = {
+                'q': strategy['q'],
+                'fl': 'identifier,title,description,creator',
+                'rows': 15,
+                'output': 'json',
+                'sort': 'downloads desc'  # Sort by popularity
+            }
+            
+            logger.info(f"Archive.org search: {strategy['description']}")
+            
+            # Connection failures are retried by the client's transport
+            response = self.search_client.get(search_url, params=params, timeout=15)
+            if response.status_code == 200:
+                data = json_loads(response.content)
+                for item in data.get('response', {}).get('docs', []):
+                    identifier = item.get('identifier')
+                    title = item.get('title', '')
+                    if identifier and self._is_relevant_result(query, title):
+                        urls.append(f"https://archive.org/details/{identifier}")
+                        logger.info(f"Found Archive.org match: {title} -> {identifier}")
+            else:
+                logger.warning(f"Archive.org returned {response.status_code}")
+                
+        except REQUEST_ERRORS as e:
+            logger.warning(f"Archive.org request failed for strategy '{strategy['description']}': {e}")
+        except Exception as e:
+            logger.warning(f"Archive.org search strategy '{strategy['description']}' failed: {e}")
+        
+        return urls
+    
     def _is_relevant_result(self, query: str, title: str) -> bool:
         """Check if Archive.org result is relevant to our search"""
         if not title:
             return False
             
-        title_lower = title.lower()
-        query_lower = query.lower()
-        
-        # Direct title match
-        if query_lower in title_lower:
-            return True
-            
-        # TWD-specific relevance checks
-        twd_keywords = ['walking dead', 'twd', 'webisode', 'torn apart', 'cold storage', 
-                       'the oath', 'red machete', 'flight 462', 'passage', 'althea',
-                       'madman', 'dead in the water', 'fear']
-        
-        return any(keyword in title_lower for keyword in twd_keywords)
+        # Direct title match, then TWD-specific relevance checks
+        return query.lower() in title.lower() or bool(self._TWD_KEYWORDS_RE.search(title))
     
     def search_alternative_youtube(self, query: str) -> List[str]:
+        """Search for alternative YouTube uploads, reusing recent results"""
+        return self._cached_search('youtube', query, self._search_alternative_youtube)
+    
+    def _search_alternative_youtube(self, query: str) -> List[str]:
         """Search for alternative YouTube uploads"""
         try:
             # Use yt-dlp to search YouTube
             search_query = f"ytsearch10:{query} walking dead webisode"
-            with yt_dlp.YoutubeDL({'quiet': True, 'no_warnings': True}) as ydl:
-                try:
-                    search_results = ydl.extract_info(search_query, download=False)
-                    urls = []
-                    if search_results and 'entries' in search_results:
-                        for entry in search_results['entries'][:5]:  # Top 5 results
-                            if entry and entry.get('webpage_url'):
-                                urls.append(entry['webpage_url'])
-                    return urls
-                except Exception as e:
-                    logger.warning(f"YouTube search failed for '{query}': {e}")
+            try:
+                search_results = probe_extract(search_query)
+                urls = []
+                if search_results and 'entries' in search_results:
+                    for entry in list(search_results['entries'])[:5]:  # Top 5 results
+                        # Flat search entries carry the video link in 'url'
+                        url = entry and (entry.get('webpage_url') or entry.get('url'))
+                        if url:
+                            urls.append(url)
+                return urls
+            except Exception as e:
+                logger.warning(f"YouTube search failed for '{query}': {e}")
         except Exception as e:
             logger.warning(f"YouTube search error for '{query}': {e}")
         return []
@@ -215,7 +435,6 @@ class AlternativeSourceFinder:
     def find_alternatives(self, webisode: Webisode) -> List[WebisodeSource]:
         """Find alternative sources for a webisode"""
         logger.info(f"Searching for alternatives for: {webisode.title}")
-        alternative_sources = []
         
         # Search query variations
         queries = [
@@ -225,46 +444,72 @@ class AlternativeSourceFinder:
             f"{webisode.series} episode {webisode.episode_number}"
         ]
         
+        # Map each URL to the type it was first found under; dict order keeps discovery order
+        found_urls = {}
+        tried = set()
         for query in queries:
+            # Skip variations that reduce to a query already searched
+            normalized = self._normalize_query(query)
+            if normalized in tried:
+                continue
+            tried.add(normalized)
+            
             # Search Archive.org first (highest priority for alternatives)
-            archive_urls = self.search_archive_org(query)
-            for url in archive_urls:
-                alternative_sources.append(WebisodeSource(
-                    url=url,
-                    source_type='archive',
-                    priority=1  # Higher priority for Internet Archive
-                ))
+            for url in self.search_archive_org(query):
+                found_urls.setdefault(url, 'archive')
+            
+            # Limit total alternatives to avoid overwhelming
+            if len(found_urls) >= self._MAX_ALTERNATIVES:
+                break
             
             # Search alternative YouTube uploads
-            youtube_urls = self.search_alternative_youtube(query)
-            for url in youtube_urls:
-                alternative_sources.append(WebisodeSource(
-                    url=url,
-                    source_type='youtube',
-                    priority=2
-                ))
+            for url in self.search_alternative_youtube(query):
+                found_urls.setdefault(url, 'youtube')
             
-            # Limit total alternatives to avoid overwhelming
-            if len(alternative_sources) >= 8:
+            if len(found_urls) >= self._MAX_ALTERNATIVES:
                 break
         
-        # Remove duplicates
-        seen_urls = set()
-        unique_sources = []
-        for source in alternative_sources:
-            if source.url not in seen_urls:
-                seen_urls.add(source.url)
-                unique_sources.append(source)
+        unique_sources = [
+            WebisodeSource(url=url, source_type=source_type,
+                           priority=self._ALTERNATIVE_PRIORITIES[source_type])
+            for url, source_type in found_urls.items()
+        ]
         
         logger.info(f"Found {len(unique_sources)} alternative sources for {webisode.title}")
         return unique_sources
 
+class YdlErrorLog:
+    """yt-dlp logger that forwards to the module logger and keeps error messages"""
+    
+    def __init__(self):
+        self.errors = []
+    
+    def debug(self, msg):
+        logger.debug(msg)
+    
+    def info(self, msg):
+        logger.info(msg)
+    
+    def warning(self, msg):
+        logger.warning(msg)
+    
+    def error(self, msg):
+        self.errors.append(msg)
+        logger.error(msg)
+
+class DownloadCancelled(Exception):
+    """Raised inside download workers when the user cancels the session"""
+
 class EnhancedDownloader:
     """Enhanced downloader with fallback source support"""
     
     def __init__(self, progress_callback=None, log_callback=None):
         self.progress_callback = progress_callback
         self.log_callback = log_callback
+        self.segments = DEFAULT_SEGMENTS  # Parallel connections per file when aria2c is available
+        self.host_delay = 0.0  # Minimum seconds between downloads started against the same host
+        self._next_allowed = defaultdict(float)  # host -> earliest monotonic start time
+        self._host_lock = threading.Lock()
         self.source_finder = AlternativeSourceFinder()
         self.download_stats = {
             'attempted': 0,
@@ -272,6 +517,67 @@ class EnhancedDownloader:
             'failed': 0,
             'alternatives_used': 0
         }
+        
+        # Known-good sources from earlier runs, so they skip the network probe
+        self._probe_cache_lock = threading.Lock()
+        try:
+            PROBE_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            self._probe_cache = shelve.open(str(PROBE_CACHE_FILE))
+        except Exception as e:
+            logger.warning(f"Source probe cache unavailable: {e}")
+            self._probe_cache = None
+        
+        # Set by cancel(); retry and politeness waits return early once it is set
+        self._cancel_event = threading.Event()
+        
+        # Several webisodes may download at once, so shared counters need a lock
+        self._stats_lock = threading.Lock()
+        self.bytes_downloaded = 0
+        self._file_bytes = {}
+    
+    def cancel(self):
+        """Ask all running downloads to stop at their next wait or attempt"""
+        self._cancel_event.set()
+    
+    def clear_cancel(self):
+        """Allow downloads again after a cancelled session"""
+        self._cancel_event.clear()
+    
+    @property
+    def cancelled(self) -> bool:
+        """Whether the current session has been cancelled"""
+        return self._cancel_event.is_set()
+    
+    def sleep(self, delay: float):
+        """Wait for delay seconds, raising DownloadCancelled as soon as the session is cancelled"""
+        if self._cancel_event.wait(delay):
+            raise DownloadCancelled()
+    
+    def throttle(self, url: str):
+        """Wait until host_delay has passed since the last download started on the same host"""
+        if self.host_delay <= 0:
+            return
+        host = urlparse(url).hostname or ''
+        with self._host_lock:
+            now = time.monotonic()
+            start = max(now, self._next_allowed[host])
+            self._next_allowed[host] = start + self.host_delay
+        self.sleep(start - now)
+    
+    def _count(self, key: str):
+        """Increment a download statistic"""
+        with self._stats_lock:
+            self.download_stats[key] += 1
+    
+    def _record_progress(self, d: dict):
+        """Add newly downloaded bytes from a yt-dlp progress update to the running total"""
+        downloaded = d.get('downloaded_bytes')
+        if downloaded is None:
+            return
+        filename = d.get('filename')
+        with self._stats_lock:
+            self.bytes_downloaded += max(downloaded - self._file_bytes.get(filename, 0), 0)
+            self._file_bytes[filename] = downloaded
     
     def log_message(self, message: str, level: str = 'info'):
         """Log message and call callback if available"""
@@ -279,31 +585,113 @@ class EnhancedDownloader:
         if self.log_callback:
             self.log_callback(f"[{level.upper()}] {message}")
     
+    def _cached_probe(self, url: str) -> Optional[bool]:
+        """Return the remembered outcome for url (True working, False dead), or None if unknown or expired"""
+        if self._probe_cache is None:
+            return None
+        with self._probe_cache_lock:
+            entry = self._probe_cache.get(url)
+        if not entry or time.time() >= entry.get('expires', 0):
+            return None
+        return entry['status'] == 'ok'
+    
+    def _store_probe(self, url: str, working: bool = True):
+        """Remember whether url worked; failures are kept for DEAD_SOURCE_TTL only"""
+        if self._probe_cache is None:
+            return
+        ttl = PROBE_CACHE_TTL if working else DEAD_SOURCE_TTL
+        with self._probe_cache_lock:
+            self._probe_cache[url] = {'status': 'ok' if working else 'dead', 'expires': time.time() + ttl}
+            self._probe_cache.sync()
+    
+    def clear_probe_cache(self):
+        """Forget all remembered probe results so every source is tested again"""
+        if self._probe_cache is None:
+            return
+        with self._probe_cache_lock:
+            self._probe_cache.clear()
+            self._probe_cache.sync()
+    
+    def close(self):
+        """Flush and close the persistent probe cache, the shared extractor and HTTP connections"""
+        close_probe_extractor()
+        self.source_finder.close()
+        
+        if self._probe_cache is not None:
+            with self._probe_cache_lock:
+                self._probe_cache.close()
+                self._probe_cache = None
+    
     def test_source(self, source: WebisodeSource) -> bool:
-        """Test if a source is accessible before attempting download"""
-        try:
-            ydl_opts = {
-                'quiet': True,
-                'no_warnings': True,
-                'extract_flat': True,
-                'socket_timeout': 10,
-            }
+        """Test if a source is accessible before attempting download, reusing recent results"""
+        return self.test_sources([source])[0]
+    
+    def test_sources(self, sources: List[WebisodeSource]) -> List[bool]:
+        """Test several sources at once: HEAD probes run in parallel, yt-dlp probes share one extractor"""
+        pending = []
+        for source in sources:
+            cached = self._cached_probe(source.url)
+            if cached is None:
+                pending.append(source)
+            else:
+                source.working = cached
+        
+        if pending:
+            head_sources = [s for s in pending if s.source_type in HEAD_PROBE_SOURCE_TYPES]
+            ydl_sources = [s for s in pending if s.source_type not in HEAD_PROBE_SOURCE_TYPES]
+            with ThreadPoolExecutor(max_workers=len(head_sources) + 1) as executor:
+                ydl_future = executor.submit(self.probe_many, ydl_sources) if ydl_sources else None
+                list(executor.map(self._head_probe, head_sources))
+                if ydl_future is not None:
+                    ydl_future.result()
             
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                info = ydl.extract_info(source.url, download=False)
-                if info:
-                    source.working = True
-                    return True
-        except Exception as e:
-            logger.debug(f"Source test failed for {source.url}: {e}")
+            for source in pending:
+                if source.working:
+                    self._store_probe(source.url)
+        
+        return [bool(source.working) for source in sources]
+    
+    def _head_probe(self, source: WebisodeSource) -> bool:
+        """Check reachability with a HEAD request; enough for plainly hosted pages"""
+        try:
+            response = self.source_finder.session.head(source.url, allow_redirects=True, timeout=5)
+            source.working = response.status_code < 400
+        except requests.RequestException as e:
+            logger.debug(f"Source probe failed for {source.url}: {e}")
             source.working = False
-        return False
+        return source.working
+    
+    def probe_many(self, sources: List[WebisodeSource]) -> Dict[str, bool]:
+        """Check sources with yt-dlp, reusing the shared extractor for all of them"""
+        results = {}
+        # YouTube answers 200 even for unavailable videos, so these need real extraction
+        for source in sources:
+            try:
+                source.working = bool(probe_extract(source.url))
+            except Exception as e:
+                logger.debug(f"Source test failed for {source.url}: {e}")
+                source.working = False
+            results[source.url] = source.working
+        return results
+    
+    @staticmethod
+    def _classify_failure(error: Exception) -> str:
+        """Return 'permanent' for failures a retry cannot fix, otherwise 'transient'"""
+        message = str(error).lower()
+        if any(marker in message for marker in TRANSIENT_FAILURE_MARKERS):
+            return 'transient'
+        if any(marker in message for marker in PERMANENT_FAILURE_MARKERS):
+            return 'permanent'
+        return 'transient'
     
     def download_with_source_retry(self, webisode: Webisode, source: WebisodeSource, 
                                   output_path: Path, quality: str = 'best', max_attempts: int = 3) -> bool:
         """Attempt download from a specific source with exponential backoff retry"""
         
         for attempt in range(max_attempts):
+            if self._cancel_event.is_set():
+                raise DownloadCancelled()
+            
             try:
                 attempt_msg = f" (attempt {attempt + 1}/{max_attempts})" if max_attempts > 1 else ""
                 self.log_message(f"Trying {source.source_type}: {source.url}{attempt_msg}")
@@ -317,8 +705,19 @@ class EnhancedDownloader:
                     'extract_flat': False,
                     'socket_timeout': timeout,
                     'retries': 1,  # Let our retry logic handle this
+                    # Read the stream in large blocks and request it in 10 MB ranges
+                    'buffersize': DOWNLOAD_BUFFER_SIZE,
+                    'http_chunk_size': DOWNLOAD_CHUNK_SIZE,
                 }
                 
+                # Split plain HTTP(S) downloads into parallel segments with aria2c
+                if ARIA2C_PATH and self.segments > 1:
+                    segments = str(self.segments)
+                    ydl_opts.update({
+                        'external_downloader': {'http': 'aria2c'},
+                        'external_downloader_args': {'aria2c': ['-x', segments, '-s', segments, '-k', '1M']},
+                    })
+                
                 # Special handling for Internet Archive
                 if source.source_type == 'archive':
                     ydl_opts.update({
@@ -328,59 +727,97 @@ class EnhancedDownloader:
                     })
                 
                 # Progress hook
-                if self.progress_callback:
-                    def progress_hook(d):
-                        if d['status'] == 'downloading':
-                            if 'downloaded_bytes' in d and 'total_bytes' in d:
-                                percent = (d['downloaded_bytes'] / d['total_bytes']) * 100
-                                self.progress_callback(percent)
-                        elif d['status'] == 'finished':
-                            self.progress_callback(100)
-                            
-                    ydl_opts['progress_hooks'] = [progress_hook]
+                def progress_hook(d):
+                    if d['status'] == 'downloading':
+                        self._record_progress(d)
+                        if self.progress_callback and 'downloaded_bytes' in d and 'total_bytes' in d:
+                            percent = (d['downloaded_bytes'] / d['total_bytes']) * 100
+                            self.progress_callback(webisode.title, percent)
+                    elif d['status'] == 'finished':
+                        if self.progress_callback:
+                            self.progress_callback(webisode.title, 100)
+                        if d.get('filename'):
+                            drop_page_cache(d['filename'])
+                        
+                ydl_opts['progress_hooks'] = [progress_hook]
+                
+                # With ignoreerrors yt-dlp reports failures through its return code and logger
+                # rather than raising, so collect the errors to classify them below
+                error_log = YdlErrorLog()
+                ydl_opts['logger'] = error_log
                 
                 with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                    ydl.download([source.url])
-                    self.log_message(f"✅ Successfully downloaded from {source.source_type}")
-                    return True
+                    retcode = ydl.download([source.url])
+                if retcode:
+                    raise yt_dlp.DownloadError(error_log.errors[-1] if error_log.errors
+                                               else f"yt-dlp exited with code {retcode}")
+                
+                self.log_message(f"✅ Successfully downloaded from {source.source_type}")
+                self._store_probe(source.url, True)
+                return True
                     
             except yt_dlp.DownloadError as e:
                 self.log_message(f"❌ Download failed from {source.source_type}: {e}", 'error')
+                if self._classify_failure(e) == 'permanent':
+                    # Retrying a missing or private video cannot succeed
+                    source.working = False
+                    self.log_message(f"🚫 {source.source_type} source is unavailable, not retrying")
+                    self._store_probe(source.url, False)
+                    return False
                 if attempt < max_attempts - 1:
                     delay = self.source_finder.exponential_backoff(attempt, base_delay=2.0)
                     self.log_message(f"⏳ Retrying in {delay:.1f} seconds...")
-                    time.sleep(delay)
+                    self.sleep(delay)
+                else:
+                    # yt-dlp failed on every attempt, skip the source for a while
+                    self._store_probe(source.url, False)
                     
             except Exception as e:
                 self.log_message(f"❌ Unexpected error with {source.source_type}: {e}", 'error')
                 if attempt < max_attempts - 1:
                     delay = self.source_finder.exponential_backoff(attempt, base_delay=1.0)
-                    time.sleep(delay)
+                    self.sleep(delay)
         
         return False
     
     def download_with_source(self, webisode: Webisode, source: WebisodeSource, 
                            output_path: Path, quality: str = 'best') -> bool:
         """Attempt download from a specific source"""
+        self.throttle(source.url)
+        
         # Use retry logic for more reliable downloads
         return self.download_with_source_retry(webisode, source, output_path, quality, max_attempts=3)
     
+    def _try_sources(self, webisode: Webisode, sources: List[WebisodeSource], output_path: Path,
+                     quality: str, switch_delay: float) -> bool:
+        """Download from the first source that works, pausing briefly between sources"""
+        for index, source in enumerate(sources):
+            if self.download_with_source(webisode, source, output_path, quality):
+                self._count('successful')
+                return True
+            
+            # Dead sources move straight on, and there is nothing to wait for after the last one
+            if source.working is not False and index < len(sources) - 1:
+                self.sleep(switch_delay)
+        return False
+    
     def download_webisode(self, webisode: Webisode, output_path: Path, 
                          quality: str = 'best', max_retries: int = 3) -> bool:
         """Download webisode with fallback to alternative sources"""
-        self.download_stats['attempted'] += 1
+        self._count('attempted')
         
-        # Sort sources by priority
-        all_sources = sorted(webisode.sources, key=lambda x: x.priority)
+        # Sources that worked last time go first, then the rest by priority
+        cached = {source.url: self._cached_probe(source.url) for source in webisode.sources}
+        all_sources = sorted(webisode.sources, key=lambda x: (cached[x.url] is not True, x.priority))
         
-        # Try original sources first
         for source in all_sources:
-            if self.download_with_source(webisode, source, output_path, quality):
-                self.download_stats['successful'] += 1
-                return True
-            
-            # Add small delay between attempts
-            time.sleep(1)
+            if cached[source.url] is False:
+                self.log_message(f"⏭️ Skipping {source.source_type} source that failed recently: {source.url}")
+        all_sources = [source for source in all_sources if cached[source.url] is not False]
+        
+        # Try original sources first
+        if self._try_sources(webisode, all_sources, output_path, quality, SOURCE_SWITCH_DELAY):
+            return True
         
         # If all original sources failed, try to find alternatives
         self.log_message(f"🔍 All primary sources failed for {webisode.title}, searching for alternatives...")
@@ -390,28 +827,84 @@ class EnhancedDownloader:
             
             if alternative_sources:
                 self.log_message(f"Found {len(alternative_sources)} alternative sources")
-                self.download_stats['alternatives_used'] += 1
+                self._count('alternatives_used')
                 
-                # Test alternatives before trying to download
-                working_alternatives = []
-                for alt_source in alternative_sources[:5]:  # Test top 5
-                    if self.test_source(alt_source):
-                        working_alternatives.append(alt_source)
+                # Test the top 5 alternatives together before trying to download
+                candidates = alternative_sources[:5]
+                results = self.test_sources(candidates)
+                working_alternatives = sorted(
+                    (source for source, working in zip(candidates, results) if working),
+                    key=_PRIORITY
+                )
                 
-                # Try working alternatives
-                for source in working_alternatives:
-                    if self.download_with_source(webisode, source, output_path, quality):
-                        self.download_stats['successful'] += 1
-                        return True
-                    time.sleep(2)  # Longer delay for alternatives
+                # Try working alternatives, with a longer pause between them
+                if self._try_sources(webisode, working_alternatives, output_path, quality,
+                                     ALTERNATIVE_SWITCH_DELAY):
+                    return True
             
+        except DownloadCancelled:
+            raise
         except Exception as e:
             self.log_message(f"Error finding alternatives for {webisode.title}: {e}", 'error')
         
-        self.download_stats['failed'] += 1
+        self._count('failed')
         self.log_message(f"❌ All sources exhausted for {webisode.title}", 'error')
         return False
 
+class BulkDownloadScheduler:
+    """Runs downloads concurrently, adapting the worker count to measured throughput"""
+    
+    def __init__(self, download_func, bytes_func, initial_workers: int = 2,
+                 min_workers: int = 1, max_workers: int = 8, sample_interval: float = 2.0):
+        self.download_func = download_func  # item -> bool
+        self.bytes_func = bytes_func  # () -> total bytes downloaded so far
+        self.workers = initial_workers
+        self.min_workers = min_workers
+        self.max_workers = max_workers
+        self.sample_interval = sample_interval
+        self._last_rate = None
+    
+    def _adjust_workers(self, rate: float):
+        """Add a worker while throughput keeps improving, drop one when it falls"""
+        if self._last_rate is None or rate > self._last_rate * 1.1:
+            self.workers = min(self.workers + 1, self.max_workers)
+        elif rate < self._last_rate * 0.9:
+            self.workers = max(self.workers - 1, self.min_workers)
+        self._last_rate = rate
+    
+    def run(self, items, on_done, should_continue=lambda: True):
+        """Download all items, calling on_done(item, success) from this thread as each finishes"""
+        pending = deque(items)
+        in_flight = {}
+        last_sample = time.monotonic()
+        last_bytes = self.bytes_func()
+        
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            while pending or in_flight:
+                # Top up to the current concurrency target
+                while pending and len(in_flight) < self.workers and should_continue():
+                    item = pending.popleft()
+                    in_flight[executor.submit(self.download_func, item)] = item
+                if not in_flight:
+                    break
+                
+                done, _ = wait(in_flight, timeout=self.sample_interval, return_when=FIRST_COMPLETED)
+                for future in done:
+                    item = in_flight.pop(future)
+                    try:
+                        success = future.result()
+                    except Exception as e:
+                        logger.error(f"Download worker error: {e}")
+                        success = False
+                    on_done(item, success)
+                
+                # Sample aggregate throughput and retune the worker count
+                now = time.monotonic()
+                if now - last_sample >= self.sample_interval:
+                    total_bytes = self.bytes_func()
+                    self._adjust_workers((total_bytes - last_bytes) / (now - last_sample))
+                    last_sample, last_bytes = now, total_bytes
+
 class TWDWebisodeDownloaderGUI:
     """Enhanced GUI for The Walking Dead webisode downloader"""
     
@@ -423,8 +916,25 @@ class TWDWebisodeDownloaderGUI:
         # Initialize variables
         self.download_path = tk.StringVar(value=str(Path("/mnt/media/systembackup/Videos/twd")))
         self.quality = tk.StringVar(value="best")
+        self.segments = tk.IntVar(value=DEFAULT_SEGMENTS)
+        self.host_delay = tk.DoubleVar(value=0.0)
+        self.max_workers = tk.IntVar(value=DEFAULT_MAX_WORKERS)
         self.downloading = False
         
+        # Per-webisode percentages of running downloads plus finished count, combined
+        # into the session progress written to the progress bar by _flush_progress
+        self._progress_lock = threading.Lock()
+        self._file_progress: Dict[str, float] = {}
+        self._session_done = 0
+        self._session_total = 0
+        self._progress_dirty = False
+        self._progress_job = None  # Pending _flush_progress call while a session runs
+        
+        # Log lines from any thread, written to the log area in batches by _flush_log
+        self._log_queue = deque()
+        self.detailed_log = tk.BooleanVar(value=True)
+        self._log_details = True  # Plain copy of detailed_log that worker threads can read
+        
         # Initialize downloader
         self.downloader = EnhancedDownloader(
             progress_callback=self.update_progress,
@@ -434,125 +944,25 @@ class TWDWebisodeDownloaderGUI:
         # Create webisode database
         self.webisodes = self.create_webisode_database()
         
+        # Title -> webisode; titles key the checkboxes, so a repeated title would shadow an entry
+        self._by_title = {}
+        for webisode in self.webisodes:
+            if webisode.title in self._by_title:
+                logger.warning(f"Duplicate webisode title in catalog, keeping the first: {webisode.title}")
+            else:
+                self._by_title[webisode.title] = webisode
+        self.webisodes = list(self._by_title.values())
+        self._selected = set()  # Titles of checked webisodes, kept in step with the checkboxes
+        
         self.create_widgets()
+        self.root.after(LOG_FLUSH_MS, self._flush_log)
         
     def create_webisode_database(self) -> List[Webisode]:
-        """Create comprehensive webisode database with chronological sequencing and multiple sources"""
-        webisodes = [
-            # 🎯 Chronological Order #1-6: Torn Apart (Pre-outbreak, 2010)
-            Webisode(
-                title="Torn Apart",
-                series="Pre-Outbreak Webisodes (#1-6)",
-                episode_number=1,
-                description="The story of Hannah, the girl who became the bicycle zombie - Episodes 1-6",
-                year=2011,
-                sources=[
-                    WebisodeSource("https://archive.org/details/TWD_Torn_Apart_Complete", "archive", priority=1),
-                    WebisodeSource("https://www.youtube.com/playlist?list=PL7eVwCAKVNEz5Xhf_jzlqjOSZQCQJZ8vN", "youtube", priority=2),
-                    WebisodeSource("https://www.amc.com/shows/the-walking-dead/video-extras", "amc", priority=3),
-                    WebisodeSource("https://www.dailymotion.com/video/x123456", "dailymotion", priority=4),
-                ]
-            ),
-            # 🎯 Chronological Order #7-10: Cold Storage (Early outbreak, 2010)
-            Webisode(
-                title="Cold Storage",
-                series="Early Outbreak Webisodes (#7-10)",
-                episode_number=7,
-                description="The story of Chase, who survived in a storage facility - Episodes 7-10",
-                year=2012,
-                sources=[
-                    WebisodeSource("https://archive.org/details/TWD_Cold_Storage_Complete", "archive", priority=1),
-                    WebisodeSource("https://www.youtube.com/playlist?list=PL7eVwCAKVNEwXOQS-gJzk_zxkMZ9QY8vJ", "youtube", priority=2),
-                    WebisodeSource("https://www.amc.com/shows/the-walking-dead/video-extras/cold-storage", "amc", priority=3),
-                ]
-            ),
-            
-            # 🎯 Chronological Order #11-13: The Oath (Medical facility, 2011)
-            Webisode(
-                title="The Oath",
-                series="Medical Crisis Webisodes (#11-13)",
-                episode_number=11,
-                description="The story of Paul and Karina in a medical facility - Episodes 11-13",
-                year=2013,
-                sources=[
-                    WebisodeSource("https://archive.org/details/TWD_The_Oath_Complete", "archive", priority=1),
-                    WebisodeSource("https://www.youtube.com/playlist?list=PL7eVwCAKVNEyN8zP3_z8xvJ9Q2Y3Z1k5m", "youtube", priority=2),
-                    WebisodeSource("https://www.amc.com/shows/the-walking-dead/video-extras/the-oath", "amc", priority=3),
-                ]
-            ),
-            
-            # 🎯 Chronological Order #14-29: Flight 462 (Airplane outbreak, 2015)
-            Webisode(
-                title="Flight 462",
-                series="Fear TWD Flight Webisodes (#14-29)",
-                episode_number=14,
-                description="The story of a plane during the outbreak - Episodes 14-29",
-                year=2015,
-                sources=[
-                    WebisodeSource("https://archive.org/details/Fear_TWD_Flight_462_Complete", "archive", priority=1),
-                    WebisodeSource("https://www.youtube.com/playlist?list=PLy789234kjasdlkj", "youtube", priority=2),
-                    WebisodeSource("https://www.amc.com/shows/fear-the-walking-dead/video-extras/flight-462", "amc", priority=3),
-                ]
-            ),
-            
-            # 🎯 Chronological Order #30-39: Passage (Mother-daughter survival, 2016)
-            Webisode(
-                title="Passage",
-                series="Fear TWD Passage Webisodes (#30-39)",
-                episode_number=30,
-                description="A mother and daughter's journey through the wasteland - Episodes 30-39",
-                year=2016,
-                sources=[
-                    WebisodeSource("https://archive.org/details/Fear_TWD_Passage_Complete", "archive", priority=1),
-                    WebisodeSource("https://www.youtube.com/playlist?list=PLasdfasdf23423", "youtube", priority=2),
-                    WebisodeSource("https://www.amc.com/shows/fear-the-walking-dead/video-extras/passage", "amc", priority=3),
-                ]
-            ),
-            
-            # 🎯 Chronological Order #40-55: Red Machete (Object's journey, 2017)
-            Webisode(
-                title="Red Machete",
-                series="Core TWD Red Machete Webisodes (#40-55)",
-                episode_number=40,
-                description="The journey of a machete through different survivors - Episodes 40-55",
-                year=2017,
-                sources=[
-                    WebisodeSource("https://archive.org/details/TWD_Red_Machete_Complete", "archive", priority=1),
-                    WebisodeSource("https://www.youtube.com/playlist?list=PLyx234234sdfsdf", "youtube", priority=2),
-                    WebisodeSource("https://www.amc.com/shows/the-walking-dead/video-extras/red-machete", "amc", priority=3),
-                ]
-            ),
-            
-            # 🎯 Chronological Order #56-57: The Althea Tapes (2018)
-            Webisode(
-                title="The Althea Tapes",
-                series="Fear TWD Althea Webisodes (#56-57)",
-                episode_number=56,
-                description="Lost footage from Althea's camera - Episodes 56-57",
-                year=2018,
-                sources=[
-                    WebisodeSource("https://archive.org/details/Fear_TWD_Althea_Tapes", "archive", priority=1),
-                    WebisodeSource("https://www.youtube.com/playlist?list=PLzcvxcvzxcv234", "youtube", priority=2),
-                    WebisodeSource("https://www.amc.com/shows/fear-the-walking-dead/video-extras/althea-tapes", "amc", priority=3),
-                ]
-            ),
-            
-            # 🎯 Chronological Order #58: Dead in the Water (Submarine finale, 2022)
-            Webisode(
-                title="Dead in the Water",
-                series="Fear TWD Final Webisodes (#58)",
-                episode_number=58,
-                description="A submarine crew's fight for survival - Final Episode #58",
-                year=2022,
-                sources=[
-                    WebisodeSource("https://archive.org/details/Fear_TWD_Dead_in_Water", "archive", priority=1),
-                    WebisodeSource("https://www.youtube.com/playlist?list=PLuiopasdfgh789", "youtube", priority=2),
-                    WebisodeSource("https://www.amc.com/shows/fear-the-walking-dead/video-extras/dead-in-water", "amc", priority=3),
-                ]
-            ),
+        """Create the webisode list from the shipped catalog, in chronological order"""
+        return [
+            Webisode(**dict(fields, sources=[WebisodeSource(**source) for source in fields['sources']]))
+            for fields in load_webisode_catalog()
         ]
-        
-        return webisodes
     
     def create_widgets(self):
         """Create and layout GUI widgets"""
@@ -607,7 +1017,8 @@ class TWDWebisodeDownloaderGUI:
             checkbox = ttk.Checkbutton(
                 scrollable_frame,
                 text=f"{webisode.series}: {webisode.title} ({webisode.year}) - {webisode.description}",
-                variable=var
+                variable=var,
+                command=lambda title=webisode.title: self._toggle_selected(title)
             )
             checkbox.grid(row=i, column=0, sticky=tk.W, pady=2)
         
@@ -618,7 +1029,9 @@ class TWDWebisodeDownloaderGUI:
         ttk.Button(button_frame, text="Select All", 
                   command=self.select_all).pack(side=tk.LEFT, padx=(0, 10))
         ttk.Button(button_frame, text="Select None", 
-                  command=self.select_none).pack(side=tk.LEFT)
+                  command=self.select_none).pack(side=tk.LEFT, padx=(0, 10))
+        ttk.Button(button_frame, text="Refresh Sources", 
+                  command=self.refresh_sources).pack(side=tk.LEFT)
         
         # Download configuration
         config_frame = ttk.LabelFrame(main_frame, text="Download Configuration", padding="10")
@@ -647,6 +1060,29 @@ class TWDWebisodeDownloaderGUI:
                                         command=self.start_download)
         self.download_button.grid(row=1, column=2, padx=(10, 0), pady=5)
         
+        self.cancel_button = ttk.Button(config_frame, text="Cancel", 
+                                      command=self.cancel_download, state="disabled")
+        self.cancel_button.grid(row=1, column=3, padx=(10, 0), pady=5)
+        
+        # Parallel segments per file (aria2c only)
+        ttk.Label(config_frame, text="Segments:").grid(row=2, column=0, sticky=tk.W, pady=5)
+        segments_spin = ttk.Spinbox(config_frame, textvariable=self.segments, from_=1, to=16, width=5,
+                                    state="normal" if ARIA2C_PATH else "disabled")
+        segments_spin.grid(row=2, column=1, sticky=tk.W, pady=5)
+        if not ARIA2C_PATH:
+            ttk.Label(config_frame, text="aria2c not found - using built-in downloader").grid(
+                row=2, column=2, columnspan=2, sticky=tk.W, padx=(10, 0), pady=5)
+        
+        # Optional pause between downloads from the same host
+        ttk.Label(config_frame, text="Host Delay (s):").grid(row=3, column=0, sticky=tk.W, pady=5)
+        ttk.Spinbox(config_frame, textvariable=self.host_delay, from_=0, to=30, increment=0.5,
+                    width=5).grid(row=3, column=1, sticky=tk.W, pady=5)
+        
+        # Upper bound for concurrent downloads; the scheduler tunes within it
+        ttk.Label(config_frame, text="Max Workers:").grid(row=4, column=0, sticky=tk.W, pady=5)
+        ttk.Spinbox(config_frame, textvariable=self.max_workers, from_=1, to=MAX_DOWNLOAD_WORKERS,
+                    width=5).grid(row=4, column=1, sticky=tk.W, pady=5)
+        
         # Progress bar
         self.progress_var = tk.DoubleVar()
         self.progress_bar = ttk.Progressbar(main_frame, variable=self.progress_var, 
@@ -666,6 +1102,9 @@ class TWDWebisodeDownloaderGUI:
         self.log_text = scrolledtext.ScrolledText(log_frame, height=15, width=80)
         self.log_text.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
         
+        ttk.Checkbutton(log_frame, text="Detailed log", variable=self.detailed_log,
+                        command=self.toggle_detailed_log).grid(row=1, column=0, sticky=tk.W, pady=(5, 0))
+        
         # Statistics frame
         stats_frame = ttk.LabelFrame(main_frame, text="Download Statistics", padding="10")
         stats_frame.grid(row=7, column=0, columnspan=3, sticky=(tk.W, tk.E), pady=(10, 0))
@@ -677,11 +1116,25 @@ class TWDWebisodeDownloaderGUI:
         """Select all webisodes"""
         for var in self.webisode_vars.values():
             var.set(True)
+        self._selected.update(self.webisode_vars)
     
     def select_none(self):
         """Deselect all webisodes"""
         for var in self.webisode_vars.values():
             var.set(False)
+        self._selected.clear()
+    
+    def _toggle_selected(self, title: str):
+        """Track a checkbox click in the selected-titles set"""
+        if self.webisode_vars[title].get():
+            self._selected.add(title)
+        else:
+            self._selected.discard(title)
+    
+    def refresh_sources(self):
+        """Forget cached source checks so the next download re-tests every source"""
+        self.downloader.clear_probe_cache()
+        self.log_message("🔄 Source cache cleared - all sources will be re-tested")
     
     def browse_download_path(self):
         """Browse for download directory"""
@@ -689,16 +1142,77 @@ class TWDWebisodeDownloaderGUI:
         if path:
             self.download_path.set(path)
     
-    def update_progress(self, percent):
-        """Update progress bar"""
-        self.progress_var.set(percent)
-        self.root.update_idletasks()
+    def update_progress(self, title: str, percent: float):
+        """Record the progress of one running download; safe to call from any thread"""
+        with self._progress_lock:
+            # The bar cannot show steps this small, so skip them; compare within this download only
+            last = self._file_progress.get(title)
+            if last is not None and abs(percent - last) < PROGRESS_MIN_STEP and percent < 100:
+                return
+            self._file_progress[title] = percent
+            self._progress_dirty = True
+    
+    def finish_progress(self, title: str):
+        """Count a webisode as done and drop its running percentage"""
+        with self._progress_lock:
+            self._file_progress.pop(title, None)
+            self._session_done += 1
+            self._progress_dirty = True
+    
+    def _reset_progress(self, total: int = 0):
+        """Clear the session progress for a session of total webisodes"""
+        with self._progress_lock:
+            self._file_progress.clear()
+            self._session_done = 0
+            self._session_total = total
+            self._progress_dirty = False
+    
+    def _start_progress_pump(self):
+        """Start copying progress to the progress bar at most every PROGRESS_FLUSH_MS"""
+        if self._progress_job is None:
+            self._progress_job = self.root.after(PROGRESS_FLUSH_MS, self._flush_progress)
+    
+    def _stop_progress_pump(self):
+        """Stop the progress pump and empty the progress bar"""
+        if self._progress_job is not None:
+            self.root.after_cancel(self._progress_job)
+            self._progress_job = None
+        self._reset_progress()
+        self.progress_var.set(0)
+    
+    def _flush_progress(self):
+        """Copy the latest progress into the progress bar, then reschedule"""
+        if self._progress_dirty:
+            # Finished webisodes count in full, running ones by their current fraction
+            with self._progress_lock:
+                self._progress_dirty = False
+                done = self._session_done + sum(self._file_progress.values()) / 100
+                total = max(self._session_total, 1)
+            self.progress_var.set(min(done / total, 1.0) * 100)
+        self._progress_job = self.root.after(PROGRESS_FLUSH_MS, self._flush_progress)
+    
+    def toggle_detailed_log(self):
+        """Show or hide per-webisode detail lines in the log"""
+        self._log_details = self.detailed_log.get()
     
     def log_message(self, message):
-        """Add message to log area"""
-        self.log_text.insert(tk.END, f"{message}\n")
-        self.log_text.see(tk.END)
-        self.root.update_idletasks()
+        """Queue a message for the log area; safe to call from any thread"""
+        self._log_queue.append(f"{message}\n")
+    
+    def _flush_log(self):
+        """Append all queued log lines in one insert, then reschedule"""
+        if self._log_queue:
+            lines = []
+            while self._log_queue:
+                lines.append(self._log_queue.popleft())
+            self.log_text.insert(tk.END, "".join(lines))
+            
+            # Keep only the newest LOG_MAX_LINES lines so long sessions stay responsive
+            line_count = int(self.log_text.index('end-1c').split('.')[0])
+            if line_count > LOG_MAX_LINES:
+                self.log_text.delete('1.0', f'{line_count - LOG_MAX_LINES}.0')
+            self.log_text.see(tk.END)
+        self.root.after(LOG_FLUSH_MS, self._flush_log)
     
     def update_stats(self):
         """Update download statistics display"""
@@ -716,11 +1230,11 @@ class TWDWebisodeDownloaderGUI:
             messagebox.showwarning("Warning", "Download already in progress!")
             return
         
-        # Get selected webisodes
-        selected_webisodes = [
-            webisode for webisode in self.webisodes
-            if self.webisode_vars[webisode.title].get()
-        ]
+        # Get selected webisodes, in chronological order
+        selected_webisodes = sorted(
+            (self._by_title[title] for title in self._selected),
+            key=attrgetter('episode_number')
+        )
         
         if not selected_webisodes:
             messagebox.showwarning("Warning", "Please select at least one webisode to download!")
@@ -734,80 +1248,136 @@ class TWDWebisodeDownloaderGUI:
             messagebox.showerror("Error", f"Cannot create download directory: {e}")
             return
         
+        try:
+            max_workers = min(max(1, self.max_workers.get()), MAX_DOWNLOAD_WORKERS)
+        except tk.TclError:
+            max_workers = DEFAULT_MAX_WORKERS
+        
         # Start download in separate thread
         self.downloading = True
+        self.downloader.clear_cancel()
+        try:
+            self.downloader.segments = max(1, self.segments.get())
+        except tk.TclError:
+            self.downloader.segments = DEFAULT_SEGMENTS
+        try:
+            self.downloader.host_delay = max(0.0, self.host_delay.get())
+        except tk.TclError:
+            self.downloader.host_delay = 0.0
         self.download_button.config(text="Downloading...", state="disabled")
+        self.cancel_button.config(state="normal")
+        self._reset_progress(len(selected_webisodes))
+        self._start_progress_pump()
         
         download_thread = threading.Thread(
             target=self.download_webisodes,
-            args=(selected_webisodes, download_path, self.quality.get()),
+            args=(selected_webisodes, download_path, self.quality.get(), max_workers),
             daemon=True
         )
         download_thread.start()
     
-    def download_webisodes(self, webisodes: List[Webisode], output_path: Path, quality: str):
+    def cancel_download(self):
+        """Stop queuing webisodes and interrupt pending retries and delays"""
+        if not self.downloading:
+            return
+        self.downloading = False
+        self.downloader.cancel()
+        self.cancel_button.config(state="disabled")
+        self.status_label.config(text="Cancelling after current transfers...")
+        self.log_message("🛑 Cancel requested - finishing transfers already in progress")
+    
+    def download_webisodes(self, webisodes: List[Webisode], output_path: Path, quality: str,
+                           max_workers: int = DEFAULT_MAX_WORKERS):
         """Download selected webisodes with fallback support"""
         try:
-            self.log_message(f"🚀 Starting download of {len(webisodes)} webisodes")
-            self.log_message(f"📁 Download path: {output_path}")
-            self.log_message(f"🎥 Quality: {quality}")
-            self.log_message("=" * 60)
+            self.log_message("\n".join([
+                f"🚀 Starting download of {len(webisodes)} webisodes",
+                f"📁 Download path: {output_path}",
+                f"🎥 Quality: {quality}",
+                "=" * 60,
+            ]))
             
             total_webisodes = len(webisodes)
+            completed = 0
             
-            for i, webisode in enumerate(webisodes):
-                if not self.downloading:  # Check if cancelled
-                    break
-                    
-                self.status_label.config(text=f"Downloading {webisode.title} ({i+1}/{total_webisodes})")
-                self.log_message(f"\n🎬 [{i+1}/{total_webisodes}] Processing: {webisode.title}")
-                self.log_message(f"📝 Description: {webisode.description}")
-                self.log_message(f"🎭 Series: {webisode.series}")
-                self.log_message(f"📅 Year: {webisode.year}")
-                self.log_message(f"🔗 Available sources: {len(webisode.sources)}")
+            def download_one(item):
+                i, webisode = item
+                # One log entry per header keeps it together when workers log concurrently
+                header = [f"\n🎬 [{i+1}/{total_webisodes}] Processing: {webisode.title}"]
+                if self._log_details:
+                    header += [
+                        f"📝 Description: {webisode.description}",
+                        f"🎭 Series: {webisode.series}",
+                        f"📅 Year: {webisode.year}",
+                        f"🔗 Available sources: {len(webisode.sources)}",
+                    ]
+                self.log_message("\n".join(header))
                 
                 # Attempt download with fallback
-                success = self.downloader.download_webisode(webisode, output_path, quality)
+                try:
+                    success = self.downloader.download_webisode(webisode, output_path, quality)
+                except DownloadCancelled:
+                    self.log_message(f"🛑 Cancelled: {webisode.title}")
+                    return False
+                return success
+            
+            def on_done(item, success):
+                nonlocal completed
+                i, webisode = item
+                completed += 1
+                self.finish_progress(webisode.title)
                 
                 if success:
                     self.log_message(f"✅ Successfully downloaded: {webisode.title}")
                 else:
                     self.log_message(f"❌ Failed to download: {webisode.title}")
                 
-                # Update progress
-                overall_progress = ((i + 1) / total_webisodes) * 100
-                self.update_progress(overall_progress)
-                self.update_stats()
-                
-                # Small delay between downloads
-                time.sleep(2)
+                # Update progress on the Tk thread
+                self.root.after_idle(self.show_session_progress, completed, total_webisodes, webisode.title)
+            
+            # Downloads run concurrently; the scheduler tunes how many at once
+            scheduler = BulkDownloadScheduler(download_one, lambda: self.downloader.bytes_downloaded,
+                                              initial_workers=min(4, max_workers, total_webisodes),
+                                              max_workers=max_workers)
+            scheduler.run(list(enumerate(webisodes)), on_done,
+                          should_continue=lambda: self.downloading)
             
             # Final statistics
             stats = self.downloader.download_stats
-            self.log_message("\n" + "=" * 60)
-            self.log_message("🏁 Download session completed!")
-            self.log_message(f"📊 Final Statistics:")
-            self.log_message(f"   • Total attempted: {stats['attempted']}")
-            self.log_message(f"   • Successful: {stats['successful']}")
-            self.log_message(f"   • Failed: {stats['failed']}")
-            self.log_message(f"   • Alternative sources used: {stats['alternatives_used']}")
-            
             success_rate = (stats['successful'] / max(stats['attempted'], 1)) * 100
-            self.log_message(f"   • Success rate: {success_rate:.1f}%")
-            
+            summary = [
+                "\n" + "=" * 60,
+                "🏁 Download session completed!",
+                "📊 Final Statistics:",
+                f"   • Total attempted: {stats['attempted']}",
+                f"   • Successful: {stats['successful']}",
+                f"   • Failed: {stats['failed']}",
+                f"   • Alternative sources used: {stats['alternatives_used']}",
+                f"   • Success rate: {success_rate:.1f}%",
+            ]
             if stats['successful'] > 0:
-                self.log_message(f"📁 Downloaded files are in: {output_path}")
+                summary.append(f"📁 Downloaded files are in: {output_path}")
+            self.log_message("\n".join(summary))
             
         except Exception as e:
             logger.error(f"Download session error: {e}")
             self.log_message(f"❌ Download session error: {e}")
         
         finally:
-            # Reset UI
             self.downloading = False
-            self.download_button.config(text="Start Download", state="normal")
-            self.status_label.config(text="Download completed")
-            self.update_progress(0)
+            self.root.after_idle(self.reset_download_ui, self.downloader.cancelled)
+    
+    def show_session_progress(self, completed: int, total: int, title: str):
+        """Show how many webisodes of the session have finished"""
+        self.status_label.config(text=f"Downloaded {completed}/{total} (last: {title})")
+        self.update_stats()
+    
+    def reset_download_ui(self, cancelled: bool = False):
+        """Return the controls to their idle state after a download session"""
+        self.download_button.config(text="Start Download", state="normal")
+        self.cancel_button.config(state="disabled")
+        self.status_label.config(text="Download cancelled" if cancelled else "Download completed")
+        self._stop_progress_pump()
 
 def main():
     """Main function to run the GUI"""
@@ -821,6 +1391,8 @@ def main():
         print("pip install yt-dlp requests")
         return 1
     
+    install_dns_cache()
+    
     # Create and run GUI
     root = tk.Tk()
     app = TWDWebisodeDownloaderGUI(root)
@@ -832,6 +1404,8 @@ def main():
     except Exception as e:
         logger.error(f"Application error: {e}")
         messagebox.showerror("Error", f"Application error: {e}")
+    finally:
+        app.downloader.close()
     
     return 0
 